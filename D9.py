@@ -1,154 +1,45 @@
 from ursina import *
-from random import randint
+from os import urandom
+from hashlib import pbkdf2_hmac
+from hmac import compare_digest
+from io import BytesIO
+from math import copysign, cos, sin
 from sqlite3 import connect
+import numpy as np
+from PIL import Image
+import matplotlib
+matplotlib.use('Agg')   # Graphs are only rendered off-screen into textures
 from matplotlib import pyplot
 
-#############################################################
-###################### MATRIX CLASS #########################
-#############################################################
-
-class Matrix:
-    """
-    Custom Matrix implementation for linear algebra operations.
-    Used for flight physics calculations (state-space model).
-    Demonstrates OOP concepts like Encapsulation and Polymorphism.
-    """
-    def __init__(self, data):
-        # data is expected as a 2D list (list of rows)
-        self.data = data
-        self.height = len(data)
-        self.width = len(data[0]) if self.height > 0 else 0
-
-    # Next 3 functions demonstrate the OOP principle of Encapsulation
-    # by providing controlled access to private attributes
-    
-    def getmatrix(self):
-        return self.data
-
-    def getheight(self):
-        return self.height
-
-    def getwidth(self):
-        return self.width
-
-    def sub(self, y, x):
-        """
-        Creates a submatrix by removing specified row and column.
-        Used in determinant calculation with the recursive minor method.
-        """
-        r = []
-        for i in range(self.height):
-            if i !=  x:
-                u = []
-                for j in range(self.width):
-                    if j !=  y:
-                        u.append(self.data[i][j])
-                r.append(u)
-        return Matrix(r)
-
-    def det(self):
-        """
-        Recursive determinant calculation using the Laplace expansion.
-        Demonstrates advanced math concept - matrix determinants.
-        Base case: 1x1 matrix determinant is the value itself.
-        Recursive case: Sum of products of elements and cofactors.
-        """
-        if self.height !=  self.width:
-            return "Error"
-        if self.width ==  1:
-            return(self.data[0][0])
-        else:
-            t = 0
-            for i in range(self.height):
-                # Calculate cofactor using submatrix
-                r = self.sub(0, i)
-                # Laplace expansion formula: element * cofactor * sign
-                t += self.data[0][i] * r.det() * ((-1)**i)
-            return t
-    
-    # Operator overloading demonstrates OOP principle of Polymorphism
-    # Allows matrices to be used with standard Python operators "+" and "*"
-    def __add__(self, other):
-        """
-        Overloads + operator for matrix addition.
-        Polymorphism - changing behavior of standard operator.
-        """
-        if self.height !=  other.height or self.width !=  other.width:
-            return "Error"
-        result = []
-        for i in range(self.height):
-            row = []
-            for j in range(self.width):
-                row.append(self.data[i][j] + other.data[i][j])
-            result.append(row)
-        return Matrix(result)
-
-    def __mul__(self, other):
-        """
-        Overloads * operator for matrix multiplication.
-        Supports both matrix-matrix and matrix-scalar multiplication.
-        Polymorphism - operator behavior changes based on operand type.
-        """
-        # If multiplying by another matrix:
-        # isinstance() function returns True if the specified object is of the specified type
-        if isinstance(other, Matrix):
-            if self.width !=  other.height:
-                return "Error"
-            result = []
-            for i in range(self.height):
-                row = []
-                for j in range(other.width):
-                    sum_val = 0
-                    for k in range(self.width):
-                        sum_val += self.data[i][k] * other.data[k][j]
-                    row.append(sum_val)
-                result.append(row)
-            return Matrix(result)
-        else:
-            # Scalar multiplication
-            result = []
-            for i in range(self.height):
-                row = []
-                for j in range(self.width):
-                    row.append(self.data[i][j] * other)
-                result.append(row)
-            return Matrix(result)
-
-    def __rmul__(self, other):
-        """
-        Overloads right multiplication to support scalar * matrix syntax.
-        Polymorphism - enables commutative property for scalar multiplication.
-        """
-        return self.__mul__(other)
-
-    def __str__(self):
-        """
-        String representation of the matrix for debugging.
-        """
-        return f'Matrix({self.data})'
-
 #############################################################
 ################### PASSWORD HASH FUNCTION ##################
 #############################################################
     
+HASH_ITERATIONS = 200_000                   # PBKDF2 rounds, tuned so one hash takes ~100 ms
+
 def generate_salt():
     """
     Generates a random salt value for password hashing.
     Cybersecurity best practice: unique salt for each password.
     """
-    return randint(31, 2**32 - 1)           # Generates a random salt in the 32-bit range
+    return urandom(16)                      # 128-bit salt from the OS cryptographic RNG
 
 def hash_password(password, salt):
     """
-    Custom password hashing algorithm implementation.
+    Password hashing using the PBKDF2-HMAC-SHA256 key derivation function.
     Demonstrates cryptographic concepts for password security:
     - Salting: adds random value to prevent rainbow table attacks
-    - Multiple transformations: bitwise XOR, binary shifts, and addition
-    - Modulo prime: keeps hash value in manageable range
+    - Key stretching: many HMAC rounds make every brute-force guess expensive
+    """
+    return pbkdf2_hmac('sha256', password.encode('utf-8'), salt, HASH_ITERATIONS)
+
+def legacy_hash_password(password, salt):
+    """
+    Original custom hash, kept only to verify accounts created before the
+    switch to PBKDF2. Those accounts are re-hashed on their next login.
     """
     hash_val = 867243217                    # Initial large "seed" prime
-    for char in password:
-        char = ord(char)                    # Convert from character to ASCII integer value
+    for char in map(ord, password):         # Convert each character to its integer code point
         hash_val = hash_val * 97            # Multiply by prime
         hash_val = hash_val ^ (char + 144479) # Imprint the ASCII value - Bitwise XOR 
         hash_val = hash_val <<((char%5) + 1)  # Imprint the ASCII value - Binary shift
@@ -158,10 +49,35 @@ def hash_password(password, salt):
     hash_val = hash_val % 387942806485727   # Mod prime smaller than 2^63-1 ensures hash_val fits in 63 bits
     return hash_val                         # Return the hash
 
+#############################################################
+#################### DATABASE CONNECTION ####################
+#############################################################
+
+def open_database(db_path):
+    """
+    Opens an SQLite connection tuned for the game's small, frequent writes.
+    WAL journaling with synchronous=NORMAL needs one sync per commit instead
+    of two, and stays crash-safe.
+    """
+    conn = connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-8000")    # Negative value = size in KiB (8 MB)
+    return conn
+
 #############################################################
 ###################### USER MANAGEMENT ######################
 #############################################################
 
+# SQL used on the login/update paths, kept together as named constants
+_SQL_USER_EXISTS = "SELECT 1 FROM users WHERE username = ? LIMIT 1"
+_SQL_INSERT_USER = "INSERT INTO users (username, password_hash, salt, level) VALUES (?, ?, ?, ?)"
+_SQL_LOGIN = "SELECT user_id, username, password_hash, salt, level, flight_minutes FROM users WHERE username = ?"
+_SQL_UPDATE_PASSWORD = "UPDATE users SET password_hash = ?, salt = ? WHERE user_id = ?"
+_SQL_UPDATE_LEVEL = "UPDATE users SET level = ? WHERE user_id = ?"
+_SQL_ADD_FLIGHT_MINUTES = "UPDATE users SET flight_minutes = flight_minutes + ? WHERE user_id = ? RETURNING flight_minutes"
+
 class User:
     """
     Represents a user in the system.
@@ -181,7 +97,7 @@ class UserManager:
     Demonstrates SQL table creation, selection, and insertion.
     """
     def __init__(self, db_path = "users.db"):
-        self.conn = connect(db_path)
+        self.conn = open_database(db_path)
         self.cursor = self.conn.cursor()
         self.create_table()
         self.add_default_user()
@@ -198,8 +114,8 @@ class UserManager:
             CREATE TABLE IF NOT EXISTS users (
                 user_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE NOT NULL,
-                password_hash INTEGER NOT NULL,
-                salt INTEGER NOT NULL,
+                password_hash BLOB NOT NULL,
+                salt BLOB NOT NULL,
                 level INTEGER DEFAULT 1,
                 flight_minutes INTEGER DEFAULT 0)""")
         self.conn.commit()
@@ -210,14 +126,13 @@ class UserManager:
         """
         username = "test"
         password = "password"
-        salt = generate_salt()
-        password_hash = hash_password(password, salt)
 
-        # Check if user exists before inserting
-        self.cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
+        # Check if user exists before inserting, so the hash is only computed when needed
+        self.cursor.execute(_SQL_USER_EXISTS, (username,))
         if not self.cursor.fetchone():
-            self.cursor.execute("INSERT INTO users (username, password_hash, salt, level) VALUES (?, ?, ?, ?)", 
-                                (username, password_hash, salt, 4))
+            salt = generate_salt()
+            password_hash = hash_password(password, salt)
+            self.cursor.execute(_SQL_INSERT_USER, (username, password_hash, salt, 4))
             self.conn.commit()
 
     def register_user(self, username, password):
@@ -227,15 +142,14 @@ class UserManager:
         Demonstrates security best practices for password storage.
         """
         # Check if the username already exists
-        self.cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
+        self.cursor.execute(_SQL_USER_EXISTS, (username,))
         if self.cursor.fetchone():
             return False  # Username already taken
 
         salt = generate_salt()
         password_hash = hash_password(password, salt)
         
-        self.cursor.execute("INSERT INTO users (username, password_hash, salt) VALUES (?, ?, ?)", 
-                            (username, password_hash, salt))
+        self.cursor.execute(_SQL_INSERT_USER, (username, password_hash, salt, 1))
         self.conn.commit()
         return True  # Registration successful
 
@@ -245,13 +159,22 @@ class UserManager:
         Returns User object if successful, None if failed.
         Demonstrates secure password verification technique.
         """
-        self.cursor.execute("SELECT user_id, username, password_hash, salt, level, flight_minutes FROM users WHERE username = ?", (username,))
+        self.cursor.execute(_SQL_LOGIN, (username,))
         user_data = self.cursor.fetchone()
         
         if user_data:
             user_id, username, stored_hash, salt, level, flight_minutes = user_data
-            # Verify password by hashing with same salt and comparing
-            if stored_hash ==  hash_password(password, salt):
+            if isinstance(salt, int):
+                # Account predates PBKDF2: verify with the old hash, then upgrade the stored hash
+                if stored_hash !=  legacy_hash_password(password, salt):
+                    return None
+                salt = generate_salt()
+                stored_hash = hash_password(password, salt)
+                self.cursor.execute(_SQL_UPDATE_PASSWORD, (stored_hash, salt, user_id))
+                self.conn.commit()
+                return User(user_id, username, stored_hash, level, flight_minutes)
+            # Verify password by hashing with same salt and comparing in constant time
+            if compare_digest(stored_hash, hash_password(password, salt)):
                 return User(user_id, username, stored_hash, level, flight_minutes)
         return None
 
@@ -268,7 +191,7 @@ class UserManager:
             new_level = 10
             
         # Update the database
-        self.cursor.execute("UPDATE users SET level = ? WHERE user_id = ?", (new_level, user_id))
+        self.cursor.execute(_SQL_UPDATE_LEVEL, (new_level, user_id))
         self.conn.commit()
         
         # Return the final level value
@@ -279,15 +202,9 @@ class UserManager:
         Updates the user's accumulated flight time in the database.
         Returns the new total flight minutes.
         """
-        # First, get current flight minutes
-        self.cursor.execute("SELECT flight_minutes FROM users WHERE user_id = ?", (user_id,))
-        current_minutes = self.cursor.fetchone()[0]
-        
-        # Calculate new total
-        new_total = current_minutes + minutes_to_add
-        
-        # Update the database
-        self.cursor.execute("UPDATE users SET flight_minutes = ? WHERE user_id = ?", (new_total, user_id))
+        # Add to the stored total and read it back in a single atomic statement
+        self.cursor.execute(_SQL_ADD_FLIGHT_MINUTES, (minutes_to_add, user_id))
+        new_total = self.cursor.fetchone()[0]
         self.conn.commit()
         
         # Return the new total
@@ -297,16 +214,37 @@ class UserManager:
 ##################### PLANE MANAGEMENT ######################
 #############################################################
 
+_SQL_INSERT_PLANE = """
+    INSERT INTO planes (name, obj_path, texture_path, description_path, matrix_path, thumbnail_path)
+    VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_ALL_PLANES_INFO = "SELECT level, name, thumbnail_path, description_path FROM planes ORDER BY level"
+_SQL_PLANE_PHYSICS = "SELECT obj_path, texture_path, matrix_path FROM planes WHERE name = ?"
+_SQL_PLANE_DESCRIPTIONS = "SELECT name, description_path FROM planes"
+
 class PlaneManager:
     """
     Manages aircraft data and database operations.
     Demonstrates DAO pattern and file I/O for configuration.
     """
+    _singleton = None   # Shared instance returned by instance()
+
     def __init__(self, db_path = "planes.db"):
-        self.conn = connect(db_path)
+        self.conn = open_database(db_path)
         self.cursor = self.conn.cursor()
+        self._planes_cache = None
         self.create_table()
         self.populate_planes()  # Populate planes right after creation
+        self.load_descriptions()
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the process-wide PlaneManager, opening the database on first use.
+        Lets every screen share one connection instead of reopening planes.db.
+        """
+        if cls._singleton is None:
+            cls._singleton = cls()
+        return cls._singleton
 
     def create_table(self):
         """
@@ -328,32 +266,51 @@ class PlaneManager:
             )""")
         self.conn.commit()
 
-    def add_plane(self, name, obj_path, texture_path, description_path, matrix_path, thumbnail_path):
+    def add_plane(self, name, obj_path, texture_path, description_path, matrix_path, thumbnail_path, commit = True):
         """
         Adds a new plane to the database.
         Demonstrates the use of prepared statements for SQL injection prevention.
+        Pass commit = False to group several inserts into one transaction.
         """
-        self.cursor.execute("""
-            INSERT INTO planes (name, obj_path, texture_path, description_path, matrix_path, thumbnail_path)
-            VALUES (?, ?, ?, ?, ?, ?)""", (name, obj_path, texture_path, description_path, matrix_path, thumbnail_path))
-        self.conn.commit()
+        # Read the description first so a missing file fails before anything is written
+        with open(description_path, "r") as f:
+            description = f.read()
+        self.cursor.execute(_SQL_INSERT_PLANE, (name, obj_path, texture_path, description_path, matrix_path, thumbnail_path))
+        if commit:
+            self.conn.commit()
+        self._planes_cache = None   # Plane list changed, reload it on next request
+        self.descriptions[name] = description
         
     def get_all_planes_info(self):
         """
         Retrieves all planes' information from the database.
         Returns a list of tuples containing plane data.
+        The result is cached, as the table does not change after it is populated.
         """
-        self.cursor.execute("SELECT level, name, thumbnail_path, description_path FROM planes ORDER BY level")
-        return self.cursor.fetchall()
+        if self._planes_cache is None:
+            self.cursor.execute(_SQL_ALL_PLANES_INFO)
+            self._planes_cache = self.cursor.fetchall()
+        return self._planes_cache
 
     def get_plane_physics(self, name):
         """
         Retrieves physics-related info of a specific plane by name.
         Used to load 3D model, texture, and flight dynamics matrices.
         """
-        self.cursor.execute("SELECT obj_path, texture_path, matrix_path FROM planes WHERE name = ?", (name,))
+        self.cursor.execute(_SQL_PLANE_PHYSICS, (name,))
         return self.cursor.fetchone()
 
+    def load_descriptions(self):
+        """
+        Reads every plane's description file once and keeps the text in memory,
+        so the main menu does not hit the disk each time it is opened.
+        """
+        self.descriptions = {}
+        self.cursor.execute(_SQL_PLANE_DESCRIPTIONS)
+        for name, description_path in self.cursor.fetchall():
+            with open(description_path, "r") as f:
+                self.descriptions[name] = f.read()
+
     def populate_planes(self):
         """
         Populates the database with default planes if empty.
@@ -368,16 +325,15 @@ class PlaneManager:
                 ("Spitfire",   "planes/Spitfire/spitfire.obj", "planes/Spitfire/texture.png",   "planes/Spitfire/desc.txt",   "planes/Spitfire/matrix.txt",   "planes/Spitfire/thumbnail.jpg"),
                 ("ORCA",       "planes/ORCA/ORCA.bam",         "planes/ORCA/texture.png",       "planes/ORCA/desc.txt",       "planes/ORCA/matrix.txt",       "planes/ORCA/thumbnail.png"),
                 ("X-Wing",     "planes/X-Wing/xwing.obj",      "planes/X-Wing/texture.png",     "planes/X-Wing/desc.txt",     "planes/X-Wing/matrix.txt",     "planes/X-Wing/thumbnail.jpg"),]
-            for plane in planes:
-                self.add_plane(plane[0], plane[1], plane[2], plane[3], plane[4], plane[5])
+            # Insert all rows in a single transaction (one commit instead of one per plane)
+            self.cursor.executemany(_SQL_INSERT_PLANE, planes)
+            self.conn.commit()
     
 #############################################################
 ################# GLOBAL VARIABLES/STATE ####################
 #############################################################
                 
 current_user = None    # will store the logged-in user
-flight_time = 0        # total flight time in seconds
-crashed = False        # indicates if the plane crashed
 
 #############################################################
 ##################### URSINA SCREENS ########################
@@ -388,6 +344,32 @@ app = Ursina(title = 'Flight Sim', development_mode = False, fullscreen = False,
 Text.default_origin = (0, 0)
 Text.default_font = "VeraMono.ttf"
 
+# Menu widgets are kept in a pool keyed by screen and role. Screens hide their
+# widgets when leaving instead of destroying them, so returning to a screen
+# reuses the existing entities rather than allocating new ones each time.
+_ui_pool = {}
+
+def pooled(key, factory, enabled = True):
+    """
+    Returns the pooled widget for key, creating it with factory() on first use.
+    The widget is enabled before being returned unless enabled = False is passed,
+    which lets a screen build everything hidden and reveal it in one go; factories
+    for hidden widgets should then construct them with enabled = False as well.
+    """
+    widget = _ui_pool.get(key)
+    if widget is None:
+        widget = _ui_pool[key] = factory()
+    if widget.enabled != enabled:
+        widget.enabled = enabled
+    return widget
+
+def release(*widgets):
+    """
+    Hides pooled widgets so a later screen can reuse them.
+    """
+    for widget in widgets:
+        widget.enabled = False
+
 # ---------------------------
 #    LOGIN SCREEN   
 # ---------------------------
@@ -399,20 +381,25 @@ class LoginScreen(Entity):
     def __init__(self, user_manager):
         super().__init__()
         self.user_manager = user_manager
-        # Create UI elements with precise positioning
-        self.title = Text(text = 'Flight Simulator', position = (0, 0.3), origin = (0, 0), scale = (3, 3))
-        self.username_txt = Text(text = 'Username:', position = (-0.25, 0.1), origin = (0, 0), scale = (1.3, 1.3))
-        self.password_txt = Text(text = 'Password:', position = (-0.25, 0), origin = (0, 0), scale = (1.3, 1.3))
-        self.username_field = InputField(position = (0, 0.1), scale = (0.3, 0.05))
-        self.password_field = InputField(position = (0, 0), scale = (0.3, 0.05), hide_content = True)
-        self.login_button = Button(text = 'Login', position = (0, -0.1), scale = (0.2, 0.05))
-        self.register_button = Button(text = 'Register', position = (0, -0.2), scale = (0.2, 0.05))
+        # Create (or reuse) UI elements with precise positioning
+        self.title = pooled('login_title', lambda: Text(text = 'Flight Simulator', position = (0, 0.3), origin = (0, 0), scale = (3, 3)))
+        self.username_txt = pooled('login_username_txt', lambda: Text(text = 'Username:', position = (-0.25, 0.1), origin = (0, 0), scale = (1.3, 1.3)))
+        self.password_txt = pooled('login_password_txt', lambda: Text(text = 'Password:', position = (-0.25, 0), origin = (0, 0), scale = (1.3, 1.3)))
+        self.username_field = pooled('login_username_field', lambda: InputField(position = (0, 0.1), scale = (0.3, 0.05)))
+        self.password_field = pooled('login_password_field', lambda: InputField(position = (0, 0), scale = (0.3, 0.05), hide_content = True))
+        self.login_button = pooled('login_login_button', lambda: Button(text = 'Login', position = (0, -0.1), scale = (0.2, 0.05)))
+        self.register_button = pooled('login_register_button', lambda: Button(text = 'Register', position = (0, -0.2), scale = (0.2, 0.05)))
 
         # Set up event handlers
         self.login_button.on_click = self.attempt_login
         self.register_button.on_click = self.go_to_register
 
-        self.info_text = Text(text = '', position = (0, -0.3), origin = (0, 0), scale = 1.5)
+        self.info_text = pooled('login_info_text', lambda: Text(text = '', position = (0, -0.3), origin = (0, 0), scale = 1.5))
+
+        # Clear anything left over from the last visit
+        self.username_field.text = ''
+        self.password_field.text = ''
+        self.info_text.text = ''
 
     def attempt_login(self):
         """
@@ -437,15 +424,9 @@ class LoginScreen(Entity):
         Cleans up UI elements when transitioning to another screen.
         Demonstrates proper resource management.
         """
-        # destroy each UI element
-        destroy(self.title)
-        destroy(self.username_field)
-        destroy(self.password_field)
-        destroy(self.username_txt)
-        destroy(self.password_txt)
-        destroy(self.login_button)
-        destroy(self.register_button)
-        destroy(self.info_text)
+        # hide each UI element so it can be reused
+        release(self.title, self.username_field, self.password_field, self.username_txt,
+                self.password_txt, self.login_button, self.register_button, self.info_text)
 
     def go_to_register(self):
         """
@@ -476,19 +457,24 @@ class RegisterScreen(Entity):
     def __init__(self, user_manager):
         super().__init__()
         self.user_manager = user_manager
-        self.username_txt = Text(text = 'Username:', position = (-0.25, 0.1), origin = (0, 0), scale = (1.3, 1.3))
-        self.password_txt = Text(text = 'Password:', position = (-0.25, 0), origin = (0, 0), scale = (1.3, 1.3))
+        self.username_txt = pooled('register_username_txt', lambda: Text(text = 'Username:', position = (-0.25, 0.1), origin = (0, 0), scale = (1.3, 1.3)))
+        self.password_txt = pooled('register_password_txt', lambda: Text(text = 'Password:', position = (-0.25, 0), origin = (0, 0), scale = (1.3, 1.3)))
         
-        self.title = Text(text = 'Register', position = (0, 0.3), origin = (0, 0), scale = (3, 3))
-        self.username_field = InputField(default_value = '', position = (0, 0.1), scale = (0.3, 0.05))
-        self.password_field = InputField(default_value = '', position = (0, 0), scale = (0.3, 0.05), hide_content = True)
-        self.register_button = Button(text = 'Register', position = (0, -0.1), scale = (0.2, 0.05))
-        self.back_button = Button(text = 'Back to Login', position = (0, -0.2), scale = (0.2, 0.05))
+        self.title = pooled('register_title', lambda: Text(text = 'Register', position = (0, 0.3), origin = (0, 0), scale = (3, 3)))
+        self.username_field = pooled('register_username_field', lambda: InputField(default_value = '', position = (0, 0.1), scale = (0.3, 0.05)))
+        self.password_field = pooled('register_password_field', lambda: InputField(default_value = '', position = (0, 0), scale = (0.3, 0.05), hide_content = True))
+        self.register_button = pooled('register_register_button', lambda: Button(text = 'Register', position = (0, -0.1), scale = (0.2, 0.05)))
+        self.back_button = pooled('register_back_button', lambda: Button(text = 'Back to Login', position = (0, -0.2), scale = (0.2, 0.05)))
 
         self.register_button.on_click = self.attempt_register
         self.back_button.on_click = self.back_to_login
 
-        self.info_text = Text(text = '', position = (0, -0.3), scale = 1.5)
+        self.info_text = pooled('register_info_text', lambda: Text(text = '', position = (0, -0.3), scale = 1.5))
+
+        # Clear anything left over from the last visit
+        self.username_field.text = ''
+        self.password_field.text = ''
+        self.info_text.text = ''
 
     def attempt_register(self):
         """
@@ -512,16 +498,16 @@ class RegisterScreen(Entity):
             self.info_text.origin = (0, 0)
             return
             
-        # Password strength check 1: No three consecutive identical characters
-        for i in range(len((password))-2):
-            if password[i] ==  password[i + 1] ==  password[i + 2]:
+        # Password strength checks in a single pass, comparing characters by index:
+        # 1. No three consecutive identical characters
+        # 2. No repeating patterns (consecutive identical character pairs)
+        for i in range(2, len(password)):
+            char = password[i]
+            if char ==  password[i - 1] ==  password[i - 2]:
                 self.info_text.text = "Password cannot have 3 consecutive identical characters!"
                 self.info_text.origin = (0, 0)
                 return
-                
-        # Password strength check 2: No repeating patterns
-        for i in range(len((password))-3):
-            if password[i:i + 2] ==  password[i + 2:i + 4]:
+            if i >= 3 and char ==  password[i - 2] and password[i - 1] ==  password[i - 3]:
                 self.info_text.text = "Password cannot have consecutive identical character pairs!"
                 self.info_text.origin = (0, 0)
                 return
@@ -541,14 +527,8 @@ class RegisterScreen(Entity):
         Returns to the login screen.
         Demonstrates proper UI cleanup.
         """
-        destroy(self.title)
-        destroy(self.username_field)
-        destroy(self.password_field)
-        destroy(self.register_button)
-        destroy(self.back_button)
-        destroy(self.info_text)
-        destroy(self.username_txt)
-        destroy(self.password_txt)
+        release(self.title, self.username_field, self.password_field, self.register_button,
+                self.back_button, self.info_text, self.username_txt, self.password_txt)
         LoginScreen(self.user_manager)  # Go back to login screen
 
 # ---------------------------
@@ -559,90 +539,88 @@ class MainMenu(Entity):
     Main menu with aircraft selection.
     Demonstrates dynamic UI creation and component interaction.
     """
-    def __init__(self, plane_manager = PlaneManager()):
+    # Plane button colors, computed once
+    _AVAILABLE_COLOR = color.black90
+    _LOCKED_COLOR = color.gray.tint(-0.4)
+
+    def __init__(self, plane_manager = None):
         super().__init__()
         camera.orthographic = True
         camera.fov = 1
         
         # Get planes from plane manager
-        self.plane_manager = plane_manager
+        self.plane_manager = plane_manager or PlaneManager.instance()
         self.planes = self.plane_manager.get_all_planes_info()
         
         # Set up UI
-        self.title = Text(text = 'Flight Simulator Main Menu', position = (0, 0.4), origin = (0, 0), scale = (2, 2))
+        self.title = pooled('menu_title', lambda: Text(text = 'Flight Simulator Main Menu', position = (0, 0.4), origin = (0, 0), scale = (2, 2), enabled = False), enabled = False)
         
         # Display user level
         global current_user
-        self.user_level_text = Text(
-            text = f'Pilot Level:\n{current_user.level} / 10',
+        self.user_level_text = pooled('menu_user_level_text', lambda: Text(
+            text = '',
             position = (-0.66, 0.4),
             origin = (0, 0),
             scale = (1.3, 1.3),
-            color = color.yellow)
+            color = color.yellow,
+            enabled = False), enabled = False)
+        self.user_level_text.text = f'Pilot Level:\n{current_user.level} / 10'
             
-        self.flight_time_text = Text(
-            text = f'Total Flight Time:\n{current_user.flight_minutes:.2f} mins',
+        self.flight_time_text = pooled('menu_flight_time_text', lambda: Text(
+            text = '',
             position = (0.66, 0.4),
             origin = (0, 0),
             scale = (1.3, 1.3),
-            color = color.yellow)
+            color = color.yellow,
+            enabled = False), enabled = False)
+        self.flight_time_text.text = f'Total Flight Time:\n{current_user.flight_minutes:.2f} mins'
             
         # Add level system explanation
-        self.level_info = Text(
+        self.level_info = pooled('menu_level_info', lambda: Text(
             text = 'Complete flights successfully to level up.\nCrashes will decrease your level.\nHigher levels unlock better aircraft!',
             position = (0, 0.3),
             origin = (0, 0),
             scale = (1, 1),
-            color = color.white)
+            color = color.white,
+            enabled = False), enabled = False)
         
-        self.start_button = Button(text = 'Start Flight Simulation', position = (0, -0.35), scale = (0.45, 0.05))
+        self.start_button = pooled('menu_start_button', lambda: Button(text = 'Start Flight Simulation', position = (0, -0.35), scale = (0.45, 0.05), enabled = False), enabled = False)
         self.start_button.on_click = self.start_simulation
-        self.quit_button = Button(text = 'Quit', position = (0, -0.45), scale = (0.25, 0.05))
+        self.quit_button = pooled('menu_quit_button', lambda: Button(text = 'Quit', position = (0, -0.45), scale = (0.25, 0.05), enabled = False), enabled = False)
         self.quit_button.on_click = application.quit
 
-        # Dictionary mapping plane names to handler functions
-        self.button_dict = {}
-        for plane in self.planes:
-            self.button_dict[plane[1]] = self.set_plane
-    
         self.buttons = {}  # Store button references for updating color
         self.descriptions = []
         self.images = []
         self.selected_plane = None  # Track selected aircraft
         self.locked_text = []  # Track locked plane text indicators
 
-        # Create buttons in a horizontal layout
-        position_x = -0.66      # Initial X position
-        offset = position_x/-2  # Spacing between buttons
-
-
-        # Create thumbnail images and descriptions
-        for i in range(len(self.planes)):
-            plane = self.planes[i]
+        # Create thumbnail, description and selection button for each plane in one pass,
+        # laid out horizontally
+        for i, plane in enumerate(self.planes):
+            position_x = -0.66 + 0.33 * i  # Calculate x position for each plane
             plane_level = plane[0]  # Level requirement for the plane
             plane_name = plane[1]   # Name of the plane
-            self.display_plane(plane[2], plane[3], offset * i + position_x, plane_level)
-
-        # Create plane selection buttons
-        for i, plane in enumerate(self.planes):
-            plane_name = plane[1]
-            plane_level = plane[0]
+            unlocked = plane_level <= current_user.level
+            self.display_plane(plane_name, plane[2], self.plane_manager.descriptions[plane_name], position_x, plane_level)
             
-            # Create the button
-            button = Button(
+            # Create (or reuse) the button
+            button = pooled(('menu_plane_button', plane_name), lambda: Button(
                 text = plane_name,
                 scale = (0.25, 0.05),
                 position = (position_x, -0.25),
-                color = color.black90 if plane_level <= current_user.level else color.gray.tint(-0.4))
+                enabled = False), enabled = False)
+            button.color = self._AVAILABLE_COLOR if unlocked else self._LOCKED_COLOR
                 
             # Set button behavior based on level requirement
-            if plane_level <= current_user.level:
+            if unlocked:
+                button.disabled = False
                 button.on_click = Func(self.set_plane, plane_name)  # Enable selection
             else:
                 button.disabled = True  # Disable the button
+                button.on_click = None  # Drop any handler left over from an earlier visit
                 
             self.buttons[plane_name] = button  # Store reference
-            position_x += offset
 
         # Set default selection to the highest level plane available to the user
         available_planes = [p[1] for p in self.planes if p[0] <= current_user.level]
@@ -652,32 +630,40 @@ class MainMenu(Entity):
             # Fallback to the first plane if somehow no planes are available
             self.set_plane(self.planes[0][1])
 
-    def display_plane(self, image_path, description_path, x, level_req):
+        # Everything was built hidden; reveal the whole menu in a single pass
+        for widget in self.widgets():
+            widget.enabled = True
+
+    def widgets(self):
+        """
+        Returns every widget currently shown by the menu.
+        """
+        return (self.title, self.user_level_text, self.flight_time_text, self.level_info,
+                self.start_button, self.quit_button, *self.buttons.values(),
+                *self.images, *self.descriptions, *self.locked_text)
+
+    def display_plane(self, plane_name, image_path, desc_text, x, level_req):
         """
         Displays a plane thumbnail and description.
-        Demonstrates file I/O for loading descriptions and images.
+        Description text is preloaded by the PlaneManager.
         """
         # Show plane thumbnail
-        self.images.append(Entity(model = 'quad', texture = image_path, position = (x, 0.12), scale = (0.25, 0.2)))
-        
-        # Read description from file
-        f = open(description_path, "r")
-        desc_text = f.read()
-        f.close()
+        self.images.append(pooled(('menu_image', plane_name), lambda: Entity(model = 'quad', texture = image_path, position = (x, 0.12), scale = (0.25, 0.2), enabled = False), enabled = False))
         
         # Add description text
-        self.descriptions.append(Text(text = desc_text, position = (x-0.128, 0.01), wordwrap = 10, scale = 0.8))
+        self.descriptions.append(pooled(('menu_description', plane_name), lambda: Text(text = desc_text, position = (x-0.128, 0.01), wordwrap = 10, scale = 0.8, enabled = False), enabled = False))
         
         # Add "LOCKED" overlay for planes that require higher level
         if level_req > current_user.level:
-            locked = Text(
+            locked = pooled(('menu_locked', plane_name), lambda: Text(
                 text = f"LOCKED\nRequires\nLevel {level_req}",
                 position = (x, 0.12),
                 origin = (0, 0),
                 scale = (1, 1),
                 color = color.red,
                 background = True,
-                background_color = color.black50)
+                background_color = color.black50,
+                enabled = False), enabled = False)
             self.locked_text.append(locked)
 
     def set_plane(self, plane_name):
@@ -688,7 +674,7 @@ class MainMenu(Entity):
         # Reset all buttons to default color
         for btn in self.buttons.values():
             if not btn.disabled:
-                btn.color = color.black90
+                btn.color = self._AVAILABLE_COLOR
 
         # Highlight the selected button
         self.buttons[plane_name].color = color.gray
@@ -698,21 +684,7 @@ class MainMenu(Entity):
         """
         Cleans up UI and transitions to the flight simulator.
         """
-        for btn in self.buttons.values():
-            destroy(btn)
-        for img in self.images:
-            destroy(img)
-        for txt in self.descriptions:
-            destroy(txt)
-        for locked in self.locked_text:
-            destroy(locked)
-        
-        destroy(self.title)
-        destroy(self.user_level_text)
-        destroy(self.flight_time_text)
-        destroy(self.level_info)
-        destroy(self.start_button)
-        destroy(self.quit_button)
+        release(*self.widgets())
         FlightSimulator(self.selected_plane, self.plane_manager)
 
 # ---------------------------
@@ -729,13 +701,14 @@ class FlightSimulator(Entity):
     """
     def __init__(self, selected_plane, plane_manager):
         super().__init__()
+        self._owned_entities = []   # Every top-level entity this flight creates, destroyed together at the end
         self.plane_manager = plane_manager
         self.plane_physics = self.plane_manager.get_plane_physics(selected_plane)
 
         self.setup_physics()
         
         # Configure 3D environment
-        self.sky = Sky(texture = 'sky_sunset')
+        self.sky = self.own(Sky(texture = 'sky_sunset'))
         self.setup_ground()
           
         camera.orthographic = False
@@ -744,11 +717,22 @@ class FlightSimulator(Entity):
         # State vectors for aircraft dynamics:
         # Longitudinal: [velocity, angle_of_attack, pitch_angle, pitch_rate]
         # Lateral: [sideslip_angle, roll_rate, yaw_angle, roll_angle]
-        self.state_long = Matrix([[0], [0], [0], [0]])
-        self.state_lat = Matrix([[0], [0], [0], [0]])
+        # Both are views into one combined state array that is updated in place
+        self.state = np.zeros((8, 1))
+        self.state_long = self.state[:4]
+        self.state_lat = self.state[4:]
+        self.controls = np.zeros((3, 1))    # Reused input vector [elevator, aileron, rudder]
 
         self.dt = 0.01667       # Time step (~60 FPS)
+
+        # Conversion constants precomputed so the per-frame math only multiplies
+        # 57.2958 is the conversion factor (180/π)
+        self._rad2deg = 57.2958
+        self._deg2rad = 1 / 57.2958
+        self._scaled_dt = self.dt * 1e-3    # Time step times the physical-to-visual movement scale
+        self._rotation_step = self._rad2deg * self.dt   # Radians/s to degrees per frame
         self.flight_time = 0    # Local flight timer
+        self.frame_count = 0    # Physics frames simulated, used to throttle UI updates
         self.run = True
         self.menu_active = False  # Track if escape menu is open
         self.crashed = False      # Track if aircraft has crashed
@@ -766,12 +750,14 @@ class FlightSimulator(Entity):
         self.setup_overlay()
         self.setup_esc_menu()
 
-        # Data collection lists for graphs
-        self.time_data = []
-        self.aoa_data = []       # Angle of Attack (state_long[1])
-        self.velocity_data = []  # Velocity (state_long[0] + cruise_speed)
-        self.gforce_data = []    # G-Force (approximated from vertical acceleration)
-        self.altitude_data = []  # Altitude (plane.y - ground_y)
+        # Data collection buffers for graphs, preallocated for a full 120 s flight
+        # and filled one sample per frame (sample_count = number of samples written)
+        max_samples = int(120 / self.dt) + 16
+        self.time_data = np.empty(max_samples)
+        self.aoa_data = np.empty(max_samples)       # Angle of Attack (state_long[1])
+        self.velocity_data = np.empty(max_samples)  # Velocity (state_long[0] + cruise_speed)
+        self.altitude_data = np.empty(max_samples)  # Altitude (plane.y - ground_y)
+        self.sample_count = 0
 
     def setup_ground(self):
         """
@@ -783,50 +769,52 @@ class FlightSimulator(Entity):
         self.ground_y = -100 # Ground altitude
         
         # Create ground mesh
-        self.ground = Entity(
+        self.ground = self.own(Entity(
             model = 'plane',
             scale = (ground_size, 1, ground_size),
             position = (0, self.ground_y, 0),
             collider = None,  # No need for physical collider, we'll handle collision manually
             texture = 'white_cube',  # Use a default texture
             texture_scale = (ground_size/20, ground_size/20),  # Repeat texture to avoid stretching
-            color = color.green.tint(-0.3))  # Adjust color to look like terrain
+            color = color.green.tint(-0.3)))  # Adjust color to look like terrain
+
+    def own(self, entity):
+        """
+        Registers a top-level entity for cleanup in end_simulation and returns it.
+        Child entities are destroyed along with their parent and need no registration.
+        """
+        self._owned_entities.append(entity)
+        return entity
 
-    def check_ground_collision(self):
+    def handle_crash(self):
         """
-        Checks if the aircraft has collided with the ground.
-        Ends the flight if a collision is detected.
+        Ends the flight after the aircraft has hit the ground.
+        Called once by update() when a ground collision is detected.
         """
-        # Get the lowest point of the aircraft (assuming the plane's pivot is at its center)
-        # Add a small buffer (e.g., 1 unit) to account for the size of the aircraft model
-        aircraft_lowest_point = self.plane.y - 1
+        self.crashed = True
+        self.run = False
         
-        # Check if the aircraft's lowest point is at or below ground level
-        if aircraft_lowest_point <= self.ground_y:
-            self.crashed = True
-            self.run = False
-            
-            # Create crash message
-            self.crash_message = Text(
-                text = 'AIRCRAFT CRASHED!',
-                position = (0, 0.2),
-                origin = (0, 0),
-                scale = 3,
-                color = color.red)
-                
-            # Add "Continue" button to proceed to post-flight analysis
-            self.continue_button = Button(
-                parent = camera.ui,
-                text = 'Continue to Analysis',
-                position = (0, 0),
-                scale = (0.4, 0.08),
-                color = color.gray.tint(.2),
-                highlight_color = color.gray.tint(.4),
-                on_click = self.end_simulation)
+        # Create crash message
+        self.crash_message = self.own(Text(
+            text = 'AIRCRAFT CRASHED!',
+            position = (0, 0.2),
+            origin = (0, 0),
+            scale = 3,
+            color = color.red))
             
-            # Optional: Add dramatic visual/audio effects for crash
-            # For example, change the plane color to indicate damage
-            self.plane.color = color.red
+        # Add "Continue" button to proceed to post-flight analysis
+        self.continue_button = self.own(Button(
+            parent = camera.ui,
+            text = 'Continue to Analysis',
+            position = (0, 0),
+            scale = (0.4, 0.08),
+            color = color.gray.tint(.2),
+            highlight_color = color.gray.tint(.4),
+            on_click = self.end_simulation))
+        
+        # Optional: Add dramatic visual/audio effects for crash
+        # For example, change the plane color to indicate damage
+        self.plane.color = color.red
 
     def setup_physics(self):
         """
@@ -835,30 +823,45 @@ class FlightSimulator(Entity):
         State-space model matrices A, B, C, D represent aircraft dynamics.
         """
         # Load 3D model and texture
-        self.plane = Entity(
+        self.plane = self.own(Entity(
             model = self.plane_physics[0],
             texture = self.plane_physics[1],
             scale = 1,
             rotation = (0, 0, 0),
-            position = (0, -2, 20))
+            position = (0, -2, 20)))
 
         # Load state-space matrices from file
+        # The file stacks four blocks of 4 rows with different widths (A: 4, B: 1, C: 4, D: 2);
+        # all 44 values are parsed in one pass by NumPy's C tokenizer and then reshaped
         matrix_path = self.plane_physics[2]
-        f = open(matrix_path, "r")
-        full_string = f.read()
-        f.close()
-        
-        # Parse matrix data from file
-        matrix_combo = [list(map(float, row.split(','))) for row in full_string.split('\n')]
-        
-        # Create state-space model matrices
-        # A and B matrices for longitudinal dynamics (pitch, velocity)
-        self.A = Matrix(matrix_combo[0:4])
-        self.B = Matrix(matrix_combo[4:8])
-        
-        # C and D matrices for lateral dynamics (roll, yaw)
-        self.C = Matrix(matrix_combo[8:12])
-        self.D = Matrix(matrix_combo[12:16])
+        with open(matrix_path, "r") as f:
+            values = np.fromstring(f.read().strip().replace('\n', ','), sep = ',')
+        if values.size !=  44:
+            raise ValueError(f'Expected 44 state-space values in {matrix_path}, found {values.size}')
+        
+        # Create state-space model matrices as float64 NumPy arrays
+        # A (4x4) and B (4x1) matrices for longitudinal dynamics (pitch, velocity)
+        self.A = values[0:16].reshape(4, 4)
+        self.B = values[16:20].reshape(4, 1)
+        
+        # C (4x4) and D (4x2) matrices for lateral dynamics (roll, yaw)
+        self.C = values[20:36].reshape(4, 4)
+        self.D = values[36:44].reshape(4, 2)
+
+        # Cruise speed is stored in the A matrix; read it once instead of every frame
+        self.cruise_speed = float(self.A[1, 2])
+
+        # Combine both subsystems into one block-diagonal 8-state system so a frame
+        # needs a single pair of matrix products instead of two:
+        #   [x_long]'   [A 0] [x_long]   [B 0] [elevator]
+        #   [x_lat ]  = [0 C] [x_lat ] + [0 D] [aileron ]
+        #                                      [rudder  ]
+        self.system_matrix = np.zeros((8, 8))
+        self.system_matrix[:4, :4] = self.A
+        self.system_matrix[4:, 4:] = self.C
+        self.input_matrix = np.zeros((8, 3))
+        self.input_matrix[:4, :1] = self.B
+        self.input_matrix[4:, 1:] = self.D
 
     def setup_overlay(self):
         """
@@ -870,23 +873,26 @@ class FlightSimulator(Entity):
         self.aileron_bar_bg, self.aileron_bar_fill = self.create_bar(-0.80, color.blue)
         self.rudder_bar_bg, self.rudder_bar_fill = self.create_bar(-0.75, color.yellow)
         self.vv_bar_bg, self.vv_bar_fill = self.create_bar(0.85, color.red)
+        self.bar_fills = (self.elevator_bar_fill, self.aileron_bar_fill, self.rudder_bar_fill, self.vv_bar_fill)
         
         # Add altitude display (moved outside loop)
-        self.altitude_text = Text(
+        self.altitude_text = self.own(Text(
             text = 'Altitude: 0 m',
             position = (0.6, -0.4),
             origin = (0, 0),
-            scale = 1.5)
+            scale = 1.5))
+        self._last_alt_int = None    # Last altitude/color written, so unchanged values skip a Text rebuild
+        self._last_alt_color = None
 
         # Updated instructions text (moved outside loop)
-        self.instructions = Text(
+        self.instructions = self.own(Text(
             text = 'Controls:\nW/S: Elevator (Pitch)\nQ/E: Aileron (Roll)\nA/D: Rudder (Yaw)\nESC: Menu',
             position = (-0.5, 0.4),
             origin = (0, 0),
-            scale = 1.5)
+            scale = 1.5))
 
     def create_bar(self, pos, fill_color):
-        bg = Entity(parent = camera.ui, model = 'quad', color = color.gray, scale = (0.03, 0.5), position = (pos, 0))
+        bg = self.own(Entity(parent = camera.ui, model = 'quad', color = color.gray, scale = (0.03, 0.5), position = (pos, 0)))
         fill = Entity(parent = bg, model = 'quad', color = fill_color, scale = (0.8, 0), position = (0, 0))
         return bg, fill
 
@@ -896,13 +902,13 @@ class FlightSimulator(Entity):
         The menu allows the player to resume or exit the simulation.
         """
         # Create menu container (initially hidden)
-        self.menu_panel = Entity(
+        self.menu_panel = self.own(Entity(
             parent = camera.ui,
             model = 'quad',
             color = color.black66,
             scale = (0.4, 0.3),
             position = (0, 0),
-            enabled = False)
+            enabled = False))
         
         # Menu title
         self.menu_title = Text(
@@ -934,7 +940,7 @@ class FlightSimulator(Entity):
             on_click = self.exit_game)
         
         # Set up input handler for ESC key
-        self.input_handler = Entity()
+        self.input_handler = self.own(Entity())
         self.input_handler.input = self.handle_input
 
     def handle_input(self, key):
@@ -997,14 +1003,23 @@ class FlightSimulator(Entity):
             # Update aircraft position and rotation
             self.update_plane()
             
-            # Check for ground collision
-            self.check_ground_collision()
+            # Check for ground collision: the aircraft's lowest point (pivot at its center,
+            # plus a 1 unit buffer for the size of the model) at or below ground level
+            if self.plane.y - 1 <= self.ground_y:
+                self.handle_crash()
+                # Still show and record the ground-contact frame, then stop
+                self.update_camera()
+                self.render_overlay()
+                self.update_data()
+                return
 
             # Update camera position to follow aircraft
             self.update_camera()
             
-            # Update UI elements
-            self.render_overlay()
+            # Update UI elements every other frame (~30 Hz is plenty for the overlay)
+            self.frame_count += 1
+            if self.frame_count & 1 ==  0:
+                self.render_overlay()
 
             # Update data collection lists for graphs
             self.update_data()
@@ -1019,27 +1034,32 @@ class FlightSimulator(Entity):
         Update elevator, aileron, and rudder based on user input.
         Demonstrates real-time control input handling.
         """
-        self.elevator = self.update_control_surface(self.elevator, 'w', 's', 5)
-        self.aileron = self.update_control_surface(self.aileron, 'e', 'q', 5)
-        self.rudder = self.update_control_surface(self.rudder, 'a', 'd', 5)
+        # Rates scaled by the time step, computed once for all three surfaces
+        d3 = 3 * self.dt    # Deflection rate while a key is held
+        d5 = 5 * self.dt    # Spring-back rate
+        d10 = 10 * self.dt  # Snap-to-zero threshold
+
+        self.elevator = self.update_control_surface(self.elevator, held_keys['w'], held_keys['s'], d3, d5, d10, 5)
+        self.aileron = self.update_control_surface(self.aileron, held_keys['e'], held_keys['q'], d3, d5, d10, 5)
+        self.rudder = self.update_control_surface(self.rudder, held_keys['a'], held_keys['d'], d3, d5, d10, 5)
 
-    def update_control_surface(self, control, increase_key, decrease_key, maximum):
+    def update_control_surface(self, control, inc, dec, d3, d5, d10, maximum):
         """
         Helper method to update a control surface based on user input.
         Implements proportional control with spring-back behavior.
+        inc/dec are the key states, d3/d5/d10 the time-step scaled rates.
         """
-        # Apply input based on key presses within limits
-        if held_keys[increase_key] and control < maximum:
-            control += 3 * self.dt
-        elif held_keys[decrease_key] and control > -maximum:
-            control -=  3 * self.dt
-        # Spring-back effect when no keys are pressed
-        elif control > 0:
-            control -=  5 * self.dt
-        elif control < 0:
-            control += 5 * self.dt
+        active = inc or dec
+
+        # Apply input based on key presses within limits, otherwise spring back towards zero
+        if active:
+            delta = d3 if inc and control < maximum else (-d3 if dec and control > -maximum else 0)
+        else:
+            delta = -d5 if control > 0 else (d5 if control < 0 else 0)
+        control = max(-maximum, min(maximum, control + delta))
+
         # Snap to zero for very small values
-        if abs(control) < 10 * self.dt and not (held_keys[increase_key] or held_keys[decrease_key]):
+        if not active and abs(control) < d10:
             control = 0
         return control
 
@@ -1061,15 +1081,17 @@ class FlightSimulator(Entity):
         - Discrete-time integration using Euler method
         - Aircraft stability and control theory
         """
-        # Update longitudinal state using matrix operations
-        # State vector: [velocity, angle_of_attack, pitch_angle, pitch_rate]
-        # Control input: elevator deflection (affects pitch primarily)
-        self.state_long += (self.A * self.state_long + self.B * self.elevator) * self.dt
-        
-        # Update lateral state using matrix operations
-        # State vector: [sideslip_angle, roll_rate, yaw_angle, roll_angle]
-        # Control inputs: aileron (roll) and rudder (yaw) deflections, constructed in to an input matrix
-        self.state_lat += (self.C * self.state_lat + self.D * Matrix([[self.aileron], [self.rudder]])) * self.dt
+        # Load this frame's control inputs into the reused input vector
+        # Elevator deflection drives the longitudinal states (pitch primarily),
+        # aileron (roll) and rudder (yaw) deflections drive the lateral states
+        controls = self.controls
+        controls[0, 0] = self.elevator
+        controls[1, 0] = self.aileron
+        controls[2, 0] = self.rudder
+
+        # Advance both subsystems at once using the combined block-diagonal system.
+        # The in-place update also refreshes the state_long/state_lat views.
+        self.state += (self.system_matrix @ self.state + self.input_matrix @ controls) * self.dt
 
     def update_plane(self):
         """
@@ -1081,42 +1103,48 @@ class FlightSimulator(Entity):
         - Euler angle rotations and their applications
         - Velocity decomposition into forward, vertical, and horizontal components
         
-        Uses the custom Matrix class for all calculations, showing practical
-        application of the OOP principles implemented earlier.
+        Reads the state vectors directly from their NumPy arrays.
         """
-        # Scale factor to convert physical units to visual representation
-        movment_scale = 1e-3
+        # Bind per-frame attributes to locals once; they are read several times below
+        deg2rad = self._deg2rad
+        rad2deg = self._rad2deg
+        state_long = self.state_long
+        state_lat = self.state_lat
+        plane = self.plane
         
         # Extract state variables and convert from degrees to radians where needed
-        # 57.2958 is the conversion factor (180/π)
-        sidelip_angle = self.state_lat.getmatrix()[0][0] / 57.2958  # Sideslip angle in radians
-        pitch_angle = -self.state_long.getmatrix()[2][0] / 57.2958  # Pitch angle in radians (note: negated)
-        yaw_angle = self.state_lat.getmatrix()[2][0] / 57.2958      # Yaw angle in radians
-        roll_angle = self.state_lat.getmatrix()[3][0] / 57.2958     # Roll angle in radians
+        sidelip_angle = state_lat[0, 0] * deg2rad  # Sideslip angle in radians
+        pitch_angle = -state_long[2, 0] * deg2rad  # Pitch angle in radians (note: negated)
+        yaw_angle = state_lat[2, 0] * deg2rad      # Yaw angle in radians
+        roll_angle = state_lat[3, 0] * deg2rad     # Roll angle in radians
         
         # Calculate velocity components
         # Adds cruise speed to current velocity perturbation (state-space models work with perturbations)
-        cruise_speed = self.A.getmatrix()[1][2]  # Extract cruise speed from A matrix (encapsulation)
-        v = self.state_long.getmatrix()[0][0] + cruise_speed  # Total airspeed
+        v = state_long[0, 0] + self.cruise_speed  # Total airspeed
+        
+        # Each sine/cosine is evaluated once per frame and reused below
+        sb = sin(sidelip_angle)
+        cb = cos(sidelip_angle)
+        sr = sin(roll_angle)
+        cr = cos(roll_angle)
         
         # Decompose velocity into components using trigonometric relationships
-        fv = v * cos(sidelip_angle)  # Forward velocity component
-        vv = self.state_long.getmatrix()[1][0]  # Vertical velocity component (from angle of attack)
-        hv = v * sin(sidelip_angle)  # Horizontal (sideways) velocity component
+        fv = v * cb  # Forward velocity component
+        vv = state_long[1, 0]  # Vertical velocity component (from angle of attack)
+        hv = v * sb  # Horizontal (sideways) velocity component
         
         # Update aircraft orientation using Euler angle transformations
         # These equations implement a simplified form of the rotation matrix transformations
         # Combines pitch and yaw effects based on current roll angle
-        self.plane.rotation_x += 57.2958 * (pitch_angle * cos(roll_angle) + yaw_angle * sin(roll_angle)) * self.dt
-        self.plane.rotation_y += 57.2958 * (pitch_angle * sin(roll_angle) + yaw_angle * cos(roll_angle)) * self.dt
-        self.plane.rotation_z = 57.2958 * roll_angle  # Direct mapping for roll angle
+        rotation_step = self._rotation_step
+        plane.rotation_x += rotation_step * (pitch_angle * cr + yaw_angle * sr)
+        plane.rotation_y += rotation_step * (pitch_angle * sr + yaw_angle * cr)
+        plane.rotation_z = rad2deg * roll_angle  # Direct mapping for roll angle
         
         # Update aircraft position using velocity components in aircraft body axes
         # Multiply by time step (dt) and scaling factor to get position change
         # Uses Ursina's vector operations through forward, up, and right vectors
-        self.plane.position += self.plane.forward * fv * self.dt * movment_scale
-        self.plane.position += self.plane.up * vv * self.dt * movment_scale
-        self.plane.position += self.plane.right * hv * self.dt * movment_scale * 50  # Note larger scale factor
+        plane.position += (plane.forward * fv + plane.up * vv + plane.right * hv * 50) * self._scaled_dt  # Note larger sideways scale factor
 
     def update_camera(self):
         """
@@ -1128,8 +1156,8 @@ class FlightSimulator(Entity):
         - Smooth following behavior through direct position updates
         """
         # Position camera behind and slightly above the aircraft
-        # Uses vector operations from the camera's perspective
-        camera.position = self.plane.position - camera.forward * 20 + camera.up * 5
+        # Uses the plane's own direction vectors, since the camera copies its rotation below
+        camera.position = self.plane.position + self.plane.back * 20 + self.plane.up * 5
         
         # Sync camera rotation with plane rotation for immersive view
         camera.rotation = self.plane.rotation
@@ -1138,119 +1166,94 @@ class FlightSimulator(Entity):
         """
         Updates the UI elements based on current flight parameters.
         """
-        # Elevator bar (original)
-        normalized_elevator = -self.elevator / 10
-        self.elevator_bar_fill.scale_y = 0.9 * abs(normalized_elevator)
-        self.elevator_bar_fill.position = (0, 0.9 * normalized_elevator / 2)
-
-        # Aileron bar
-        normalized_aileron = -self.aileron / 10
-        self.aileron_bar_fill.scale_y = 0.9 * abs(normalized_aileron)
-        self.aileron_bar_fill.position = (0, 0.9 * normalized_aileron / 2)
-
-        # Rudder bar
-        normalized_rudder = -self.rudder / 10
-        self.rudder_bar_fill.scale_y = 0.9 * abs(normalized_rudder)
-        self.rudder_bar_fill.position = (0, 0.9 * normalized_rudder / 2)
-
-        # Vertical velocity bar
-        # Scale vertical velocity (state_long[1]) to a reasonable display range
-        if self.state_long.getmatrix()[1][0] < 0:
-            normalized_vv = 1 / (-0.001 * self.state_long.getmatrix()[1][0] + 2) - 0.5
-        else:
-            normalized_vv = - 1 / (0.001 * self.state_long.getmatrix()[1][0] + 2) + 0.5 # Adjust divisor based on expected vv range
-        self.vv_bar_fill.scale_y = 0.9 * abs(normalized_vv)
-        self.vv_bar_fill.position = (0, 0.9 * normalized_vv / 2)
+        # Vertical velocity (state_long[1]) scaled to a reasonable display range:
+        # +/-(0.5 - 1 / (0.001 * |vv| + 2)), signed like vv; adjust the 0.001 factor for the expected vv range
+        vv = self.state_long[1, 0]
+        normalized_vv = copysign(0.5 - 1 / (0.001 * abs(vv) + 2), vv)
+
+        # Elevator, aileron, rudder and vertical velocity bars share the same fill arithmetic
+        normalized = (-self.elevator / 10, -self.aileron / 10, -self.rudder / 10, normalized_vv)
+        for bar, value in zip(self.bar_fills, normalized):
+            bar.scale_y = 0.9 * abs(value)
+            bar.y = 0.45 * value
 
         # Calculate altitude (y position above ground level)
         altitude = self.plane.y - self.ground_y # Offset by ground level position
         
         # Add warning for low altitude (change text color when below 100m)
-        if altitude < 75:
-            self.altitude_text.color = color.red
-        else:
-            self.altitude_text.color = color.white
-            
-        self.altitude_text.text = f'Altitude: {int(altitude)} m'
+        new_color = color.red if altitude < 75 else color.white
+        if new_color is not self._last_alt_color:   # color.red/white are module singletons
+            self.altitude_text.color = new_color
+            self._last_alt_color = new_color
+
+        # Assigning .text regenerates the glyph geometry, so only do it when the shown metre changes
+        ai = int(altitude)
+        if ai != self._last_alt_int:
+            self.altitude_text.text = f'Altitude: {ai} m'
+            self._last_alt_int = ai
 
     def update_data(self):
-        self.time_data.append(self.flight_time)
-        self.aoa_data.append(self.state_long.getmatrix()[1][0])  # Angle of Attack in degrees
-        cruise_speed = self.A.getmatrix()[1][2]
-        self.velocity_data.append(self.state_long.getmatrix()[0][0] + cruise_speed)  # Total velocity
-        # Approximate G-force as vertical acceleration (dv/dt) / 9.81
-        if len(self.velocity_data) > 1:
-            dv_dt = (self.velocity_data[-1] - self.velocity_data[-2]) / self.dt
-            g_force = dv_dt / 9.81  # Assuming vertical component dominates
-        else:
-            g_force = 0
-        self.gforce_data.append(g_force)
-        self.altitude_data.append(self.plane.y - self.ground_y)  # Altitude above ground
+        i = self.sample_count
+        self.time_data[i] = self.flight_time
+        self.aoa_data[i] = self.state_long[1, 0]  # Angle of Attack in degrees
+        self.velocity_data[i] = self.state_long[0, 0] + self.cruise_speed  # Total velocity
+        self.altitude_data[i] = self.plane.y - self.ground_y  # Altitude above ground
+        self.sample_count = i + 1
         
         
     def end_simulation(self):
         """
         Cleans up resources and transitions to post-flight analysis.
         """
-        global flight_time, crashed
-        
-        flight_time = self.flight_time
-        
-        # Record crash status for post-flight analysis
-        crashed = self.crashed
+        # Store data for post-flight analysis (only the samples actually recorded)
+        n = self.sample_count
+        velocity = self.velocity_data[:n]
+
+        # Approximate G-force as acceleration (dv/dt) / 9.81 for the whole flight at once
+        # (assuming the vertical component dominates); the first sample has no predecessor
+        gforce = np.zeros(n)
+        gforce[1:] = np.diff(velocity) / (self.dt * 9.81)
 
-        # Store data for post-flight analysis
         self.flight_data = {
-            'time': self.time_data,
-            'aoa': self.aoa_data,
-            'velocity': self.velocity_data,
-            'gforce': self.gforce_data,
-            'altitude': self.altitude_data}
-        
-        # Clean up all entities including menu elements and ground
-        destroy(self.plane)
-        destroy(self.sky)
-        destroy(self.ground)
-        
-        # Clean up UI elements
-        destroy(self.instructions)
-        destroy(self.altitude_text)
-        destroy(self.elevator_bar_bg)
-        destroy(self.aileron_bar_bg)
-        destroy(self.rudder_bar_bg)
-        destroy(self.vv_bar_bg)
-        destroy(self.menu_panel)
-        destroy(self.input_handler)
+            'time': self.time_data[:n],
+            'aoa': self.aoa_data[:n],
+            'velocity': velocity,
+            'gforce': gforce,
+            'altitude': self.altitude_data[:n]}
         
-        # Clean up crash-specific elements if they exist
-        if self.crash_message:
-            destroy(self.crash_message)
-            destroy(self.continue_button)
+        # Clean up every entity this flight created: plane, sky, ground, overlay,
+        # pause menu, input handler and the crash elements if there was a crash
+        for entity in self._owned_entities:
+            destroy(entity)
+        self._owned_entities.clear()
         
-        # Transition to post-flight analysis
-        PostFlight(self.flight_data)
+        # Transition to post-flight analysis, handing over flight time and crash status
+        PostFlight(self.flight_data, self.flight_time, self.crashed)
 
 # ---------------------------
 #   POST-FLIGHT ANALYTICS
 # ---------------------------
 class PostFlight(Entity):
-    def __init__(self, flight_data = None):
+    def __init__(self, flight_data = None, flight_time = 0.0, crashed = False):
         super().__init__()
+        self._owned_entities = []       # Every entity this screen creates, destroyed together on exit
+        self.flight_time = flight_time  # Total flight time in seconds
+        self.crashed = crashed          # Whether the flight ended in a crash
 
         title_y = 0.4
         stats_y = 0.325
         graph_y = 0.05
         message_y = -0.225
         
-        self.title = Text(text = 'Post-Flight Analytics', position = (0, title_y), scale = (2, 2), origin = (0, 0))
+        self.title = self.own(Text(text = 'Post-Flight Analytics', position = (0, title_y), scale = (2, 2), origin = (0, 0)))
 
         # Display flight time
-        global flight_time, current_user, crashed
+        global current_user
         minutes_to_add = flight_time / 60  # Convert seconds to minutes
         
-        self.flight_time_text = Text(
+        self.flight_time_text = self.own(Text(
             text = f'Flight Time: {flight_time:.2f} seconds',
-            position = (0, stats_y), origin = (0, 0))
+            position = (0, stats_y), origin = (0, 0)))
         
         # Initialize level-up related attributes
         self.level_up = False
@@ -1282,44 +1285,51 @@ class PostFlight(Entity):
             current_user.level = self.new_level
             
             # Display level information
-            self.level_text = Text(
+            self.level_text = self.own(Text(
                 text = f'Current Pilot Level: {current_user.level}',
                 position = (0.5, stats_y),
-                origin = (0, 0))
+                origin = (0, 0)))
             
-            self.total_time_text = Text(
+            self.total_time_text = self.own(Text(
                 text = f'Total Flight Minutes: {self.new_total_minutes:.2f}',
                 position = (-0.5, stats_y),
-                origin = (0, 0))
+                origin = (0, 0)))
             
             if self.level_up:
-                self.level_up_text = Text(
+                self.level_up_text = self.own(Text(
                     text = f'CONGRATULATIONS! You\'ve reached Level {self.new_level}!',
-                    position = (0, message_y), origin = (0, 0), color = color.yellow)
+                    position = (0, message_y), origin = (0, 0), color = color.yellow))
                 
             elif self.level_down:
-                self.level_down_text = Text(
+                self.level_down_text = self.own(Text(
                     text = f'Crash Detected! Level decreased to {self.new_level}',
-                    position = (0, message_y), origin = (0, 0), color = color.red.tint(-0.2))
+                    position = (0, message_y), origin = (0, 0), color = color.red.tint(-0.2)))
                 
             else:
                 # Show progress to next level
                 minutes_to_next = required_minutes[current_user.level] - self.new_total_minutes
                 if minutes_to_next < 0:
                     minutes_to_next = 0
-                self.progress_text = Text(
+                self.progress_text = self.own(Text(
                     text = f'Minutes to next level: {minutes_to_next:.2f}',
-                    position = (0, message_y), origin = (0, 0))
+                    position = (0, message_y), origin = (0, 0)))
         
         # Navigation buttons
-        self.menu_button = Button(text = 'Return to Main Menu', position = (0, -0.3), scale = (0.35, 0.05))
+        self.menu_button = self.own(Button(text = 'Return to Main Menu', position = (0, -0.3), scale = (0.35, 0.05)))
         self.menu_button.on_click = self.return_to_menu
-        self.quit_button = Button(text = 'Quit', position = (0, -0.4), scale = (0.25, 0.05))
+        self.quit_button = self.own(Button(text = 'Quit', position = (0, -0.4), scale = (0.25, 0.05)))
         self.quit_button.on_click = application.quit
 
         if flight_data:
             self.generate_graphs(flight_data, graph_y)
 
+    def own(self, entity):
+        """
+        Registers an entity for cleanup in return_to_menu and returns it.
+        """
+        self._owned_entities.append(entity)
+        return entity
+
     def generate_graphs(self, flight_data, graph_y):
         """
         Generate four graphs side by side using Matplotlib and display them within Ursina UI.
@@ -1327,12 +1337,21 @@ class PostFlight(Entity):
 
         graph_size = 1.7
         
-        # Extract data
-        time = flight_data['time']
-        aoa = flight_data['aoa']
-        velocity = flight_data['velocity']
-        gforce = flight_data['gforce']
-        altitude = flight_data['altitude']
+        # Extract data, keeping every k-th sample so each line has at most ~800 points
+        # (a 120 s flight records ~7200 samples, far more than the rendered graph width).
+        # The last sample (the ground-contact frame after a crash, recorded by update())
+        # and the g-force extremes are always kept.
+        n = len(flight_data['time'])
+        k = max(1, n // 800)
+        keep = np.arange(0, n, k)
+        if n:
+            gforce = flight_data['gforce']
+            keep = np.union1d(keep, (n - 1, gforce.argmax(), gforce.argmin()))
+        time = flight_data['time'][keep]
+        aoa = flight_data['aoa'][keep]
+        velocity = flight_data['velocity'][keep]
+        gforce = flight_data['gforce'][keep]
+        altitude = flight_data['altitude'][keep]
 
         # Create a figure with 4 subplots in a horizontal layout (1 row, 4 columns)
         fig, axs = pyplot.subplots(1, 4, figsize=(16, 4))  # Width=16, Height=4 for horizontal layout
@@ -1369,46 +1388,29 @@ class PostFlight(Entity):
         # Adjust layout to prevent overlap and ensure proper spacing
         pyplot.tight_layout(rect=[0, 0, 1, 0.95])  # Leave space for subtitle
 
-        # Save the plot to a temporary file
-        temp_file = 'temp_graphs.png'
-        pyplot.savefig(temp_file, format = 'png', dpi = 300)  # DPI=100 for reasonable quality
+        # Render the plot into an in-memory PNG instead of a temporary file
+        buffer = BytesIO()
+        fig.savefig(buffer, format = 'png', dpi = 100)  # DPI=100 (1600x400) matches the on-screen size
         pyplot.close(fig)  # Close the figure to free memory
 
-        # Load the saved image as a texture in Ursina
-        graph_texture = Texture(temp_file)
+        # Load the rendered image as a texture in Ursina
+        buffer.seek(0)
+        graph_texture = Texture(Image.open(buffer))
 
         # Display the graphs as an Entity in Ursina UI
-        self.graph_entity = Entity(
+        self.graph_entity = self.own(Entity(
             parent = camera.ui,  # Attach to UI layer
             model = 'quad',
             texture = graph_texture,
             scale=(graph_size, graph_size/4),  # Width & Height to match AR of figsize = (16, 4)
             position = (0, graph_y),  # Slightly above center to fit with other UI elements
-            z = -1)  # Render behind buttons
+            z = -1))  # Render behind buttons
         
     def return_to_menu(self):
-        destroy(self.title)
-        destroy(self.flight_time_text)
-        
-        # Destroy level-related texts if they exist
-        if current_user:
-            destroy(self.level_text)
-            destroy(self.total_time_text)
-            if self.level_up:
-                destroy(self.level_up_text)
-            elif self.level_down:
-                destroy(self.level_down_text)
-            else:
-                destroy(self.progress_text)
-        
-        destroy(self.menu_button)
-        destroy(self.quit_button)
-        destroy(self.graph_entity)
-        
-        # Reset flight statistics for next session
-        global flight_time, crashed
-        flight_time = 0
-        crashed = False
+        # Destroy every text, button and graph this screen created (level-related texts only exist when logged in)
+        for entity in self._owned_entities:
+            destroy(entity)
+        self._owned_entities.clear()
         
         MainMenu()
 